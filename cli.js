@@ -1,7 +1,9 @@
 #!/usr/bin/env node
 
-import { generatePdf } from './pdfGenerate.js';
+import { generatePdf, closeGenerator } from './pdfGenerate.js';
 import path from 'path';
+import fs from 'fs';
+import readline from 'readline';
 import { performance } from 'perf_hooks';
 
 class CLIHandler {
@@ -30,19 +32,70 @@ class CLIHandler {
         }
     }
 
+    async readStdin() {
+        const chunks = [];
+        for await (const chunk of process.stdin) {
+            chunks.push(chunk);
+        }
+        return Buffer.concat(chunks).toString('utf-8');
+    }
+
+    async serve() {
+        // stdout carries one JSON response per request line, so logs go to stderr
+        console.log = console.error;
+
+        const rl = readline.createInterface({ input: process.stdin, crlfDelay: Infinity });
+
+        // Requests are handled one at a time, keeping the browser warm in between
+        for await (const line of rl) {
+            if (!line.trim()) continue;
+
+            let response;
+            try {
+                const message = JSON.parse(line);
+                if (message.op === 'shutdown') break;
+
+                this.startTime = performance.now();
+                const outputPath = await this.generatePDFCli(message.data, message.output);
+                response = { ok: true, output: outputPath };
+            } catch (error) {
+                response = { ok: false, error: error.message };
+            }
+            process.stdout.write(JSON.stringify(response) + '\n');
+        }
+
+        await closeGenerator();
+        process.exit(0);
+    }
+
     async run() {
         try {
             const args = process.argv.slice(2);
 
+            if (args.includes('--server')) {
+                await this.serve();
+                return;
+            }
+
             const dataArgIndex = args.indexOf('--data');
+            const dataFileArgIndex = args.indexOf('--data-file');
+            const useStdin = args.includes('--stdin');
             const outputArgIndex = args.indexOf('--output');
 
-            if (dataArgIndex === -1 || outputArgIndex === -1) {
-                throw new Error('Invalid arguments. Provide --data and --output.');
+            if ((dataArgIndex === -1 && dataFileArgIndex === -1 && !useStdin) || outputArgIndex === -1) {
+                throw new Error('Invalid arguments. Provide --data (or --data-file / --stdin) and --output, or --server.');
             }
             
             // Parse JSON data
-            const jsonData =  JSON.parse(args[dataArgIndex + 1]);
+            let rawData;
+            if (dataFileArgIndex !== -1) {
+                rawData = fs.readFileSync(args[dataFileArgIndex + 1], 'utf-8');
+            } else if (useStdin) {
+                rawData = await this.readStdin();
+            } else {
+                rawData = args[dataArgIndex + 1];
+            }
+            const jsonData = JSON.parse(rawData);
             const outputPath = args[outputArgIndex + 1];
             
             // Generate PDF
@@ -9,6 +9,7 @@ import { fileURLToPath } from 'url';
 import customCSS from './customStyles.js';
 // import { customFonts } from './templates/partials/customFonts.js';
 import myCustomFonts from './customFonts.js';
+import { renderRadarSvg } from './radarChart.js';
 
 const __dirname = path.dirname(fileURLToPath(import.meta.url));
 
@@ -21,7 +22,8 @@ class OptimizedPDFGenerator {
     }
 
     async initialize() {
-        if (this.isInitialized) return;
+        // A persistent worker can outlive a crashed browser, so relaunch then
+        if (this.isInitialized && this.browser?.connected) return;
 
         console.log('🚀 Initializing PDF Generator...');
 
@@ -50,6 +52,14 @@ class OptimizedPDFGenerator {
             defaultViewport: { width: 794, height: 1123 },
         });
 
+        const browser = this.browser;
+        browser.on('disconnected', () => {
+            if (this.browser !== browser) return;  // already replaced or closed
+            console.warn('⚠️  Browser disconnected, relaunching on next request');
+            this.browser = null;
+            this.isInitialized = false;
+        });
+
         await Promise.all([
             this.preloadTemplates(),
             // this.getSortedEJSTemplates(),
@@ -200,11 +210,17 @@ class OptimizedPDFGenerator {
         const pageCount = 10;
         const orderedTemplateList = Array.from({ length: pageCount }, (_, i) => `page${i + 1}.ejs`);
 
+        // Chart is drawn once here and shared by every page template
+        const pageData = {
+            ...data,
+            RadarGraphSVG: renderRadarSvg(data.EDAPPGS006.ResultInfo.genetic_results),
+        };
+
         const buffers = [];
 
         // for (const pageFile of pages) {
         for (const pageFile of orderedTemplateList) {
-            const html = await this.renderTemplate(pageFile, data);
+            const html = await this.renderTemplate(pageFile, pageData);
             const buffer = await this.generatePagePDF(html);
             buffers.push(buffer);
         }
@@ -224,7 +240,17 @@ class OptimizedPDFGenerator {
 
         return outputPath;
     }
+
+    async close() {
+        const browser = this.browser;
+        this.browser = null;
+        this.isInitialized = false;
+        if (browser) {
+            await browser.close();
+        }
+    }
 }
 
 const generator = new OptimizedPDFGenerator();
 export const generatePdf = (params) => generator.generatePdf(params);
+export const closeGenerator = () => generator.close();
@@ -0,0 +1,92 @@
+// radarChart.js
+// Renders the page 4 radar chart as an inline SVG string from the
+// genetic_results scores. Coordinates are in data units (outer ring = 100)
+// with the y axis pointing down; sizes mirror the old matplotlib output.
+
+const MAX_VALUE = 100;
+const RING_STEP = 25;
+const FONT_SIZE = 4.87;
+
+// Format a coordinate compactly at 0.1 unit precision ("-0" folds to "0")
+const num = (value) => String(Math.round(value * 10) / 10 + 0);
+
+const points = (coords) => coords.map(([x, y]) => `${num(x)},${num(y)}`).join(' ');
+
+// Unit vectors for each axis, clockwise from 12 o'clock
+function axisVectors(count) {
+    return Array.from({ length: count }, (_, i) => {
+        const angle = Math.PI / 2 - (2 * Math.PI * i) / count;
+        return [Math.cos(angle), -Math.sin(angle)];
+    });
+}
+
+// Grid rings, spokes and labels only depend on the axis count
+const gridCache = new Map();
+
+function renderGrid(count) {
+    if (gridCache.has(count)) return gridCache.get(count);
+
+    const axes = axisVectors(count);
+    const ring = (radius) => points(axes.map(([x, y]) => [radius * x, radius * y]));
+    const dashed = 'fill="none" stroke="#808080" stroke-width=".27" stroke-dasharray="1,.43"';
+
+    const elements = [`<g ${dashed} stroke-opacity=".7">`];
+    for (let radius = RING_STEP; radius < MAX_VALUE; radius += RING_STEP) {
+        elements.push(`<polygon points="${ring(radius)}"/>`);
+    }
+    elements.push(`</g><polygon points="${ring(MAX_VALUE)}" fill="none" stroke="#333" stroke-width=".81"/>`);
+
+    elements.push(`<g ${dashed} stroke-opacity=".5">`);
+    for (const [x, y] of axes) {
+        elements.push(`<path d="M0 0L${num(MAX_VALUE * x)} ${num(MAX_VALUE * y)}"/>`);
+    }
+    elements.push('</g>');
+
+    const labelAngle = -Math.PI / 6; // -30 degrees
+    elements.push('<g text-anchor="end">');
+    for (let radius = RING_STEP; radius <= MAX_VALUE; radius += RING_STEP) {
+        const x = radius * 0.9 * Math.cos(labelAngle);
+        const y = -radius * 0.9 * Math.sin(labelAngle);
+        const label = `${radius}%`;
+        // Approximate Arial advance widths: digits 0.556em, '%' 0.889em
+        const textWidth = (0.556 * (label.length - 1) + 0.889) * FONT_SIZE;
+        elements.push(
+            `<rect x="${num(x - textWidth - 0.54)}" y="${num(y - 0.54)}" width="${num(textWidth + 1.08)}" ` +
+            'height="5.95" fill="#F1F9FF" fill-opacity=".8"/>' +
+            `<text x="${num(x)}" y="${num(y)}" dominant-baseline="hanging" fill="#808080">${label}</text>`
+        );
+    }
+    elements.push('</g>');
+
+    const grid = elements.join('');
+    gridCache.set(count, grid);
+    return grid;
+}
+
+// Scores must be whole numbers; anything else fails the request rather than
+// drawing a NaN or truncated polygon into the PDF
+function parseScore(raw) {
+    const isNumeric = typeof raw === 'number' || (typeof raw === 'string' && raw.trim() !== '');
+    const value = isNumeric ? Number(raw) : NaN;
+    if (!Number.isInteger(value)) {
+        throw new Error(`Invalid radar chart score: ${JSON.stringify(raw)}`);
+    }
+    return value;
+}
+
+export function renderRadarSvg(geneticResults) {
+    const values = Object.values(geneticResults).map(result => parseScore(result.result));
+    const axes = axisVectors(values.length);
+    const dataPoints = points(values.map((value, i) => [value * axes[i][0], value * axes[i][1]]));
+
+    return (
+        '<svg xmlns="http://www.w3.org/2000/svg" width="458pt" height="458pt" ' +
+        `viewBox="-124 -124 248 248" font-family="Arial" font-size="${FONT_SIZE}">` +
+        renderGrid(values.length) +
+        `<polygon points="${dataPoints}" fill="#E6E6FA" fill-opacity=".2" ` +
+        'stroke="#6A1B9A" stroke-width="1.08" stroke-linejoin="round"/>' +
+        '<circle r="2.16"/>' +
+        '<text y="3" text-anchor="middle" dominant-baseline="hanging">0%</text>' +
+        '</svg>'
+    );
+}
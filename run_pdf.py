@@ -1,20 +1,23 @@
 import subprocess
 import os
 import time
-import base64
-from io import BytesIO
-import numpy as np
-import matplotlib
-import matplotlib.pyplot as plt
 import json
 import tempfile
-from functools import lru_cache
 # from concurrent.futures import ThreadPoolExecutor
 import logging
 
-# Configure matplotlib for better performance
-matplotlib.use('Agg')  # Use non-interactive backend
-plt.ioff()  # Turn off interactive mode
+try:
+    import orjson  # optional; returns bytes directly
+except ImportError:
+    orjson = None
+
+
+def _dumps_json(obj):
+    """Serialize ``obj`` to compact JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -23,156 +26,48 @@ logger = logging.getLogger(__name__)
 class PDFGenerator:
     """Optimized PDF Generator with caching and memory management"""
     
-    def __init__(self, output_dir='output', images_dir='public/images'):
+    def __init__(self, output_dir='output'):
         self.output_dir = output_dir
-        self.images_dir = images_dir
+        self._node = None  # persistent Node.js worker, started lazily
         self._ensure_directories()
         
     def _ensure_directories(self):
         """Create necessary directories if they don't exist"""
-        for directory in [self.output_dir, self.images_dir]:
-            os.makedirs(directory, exist_ok=True)
-    
-    @lru_cache(maxsize=128)
-    def _calculate_radar_positions(self, n_points=6):
-        """Cache radar chart angle calculations"""
-        return [np.pi/2 - 2*np.pi*i/n_points for i in range(n_points)]
+        os.makedirs(self.output_dir, exist_ok=True)
     
-    def _create_radar_grid(self, ax, angles, max_value=100):
-        """Optimized radar grid creation"""
-        # Pre-calculate grid values
-        grid_values = range(25, max_value + 1, 25)
-        
-        for radial_value in grid_values:
-            # Calculate grid coordinates once
-            grid_coords = [(radial_value * np.cos(theta), radial_value * np.sin(theta)) 
-                            for theta in angles]
-            grid_coords.append(grid_coords[0])  # Close the polygon
-            
-            grid_x, grid_y = zip(*grid_coords)
-            
-            line_props = {
-                'color': '#333333' if radial_value == max_value else 'gray',
-                'linewidth': 1.5 if radial_value == max_value else 0.5,
-                'linestyle': '-' if radial_value == max_value else '--',
-                'alpha': 1.0 if radial_value == max_value else 0.7
-            }
-            ax.plot(grid_x, grid_y, **line_props)
+    def prepare_pdf_data(self, raw_data):
+        """Prepare and enrich data for PDF generation"""
+        # The radar chart is drawn by the Node.js side from
+        # genetic_results, so the data is forwarded as-is
+        return raw_data
     
-    def _add_radar_labels(self, ax, angles, max_value=100):
-        """Add percentage labels to radar chart"""
-        label_angle = -np.pi/6  # -30 degrees
+    def _ensure_node_worker(self):
+        """Start the long-lived Node.js PDF worker on first use"""
+        if self._node is not None and self._node.poll() is not None:
+            self._discard_node_worker(self._node)
         
-        for radial_value in range(25, max_value + 1, 25):
-            x_label = (radial_value * 0.90) * np.cos(label_angle)
-            y_label = (radial_value * 0.90) * np.sin(label_angle)
-            
-            ax.text(x_label, y_label, f'{radial_value}%', 
-                    ha='right', va='top', color='gray', fontsize=9,
-                    fontfamily='Arial',
-                    bbox=dict(facecolor='#F1F9FF', alpha=0.8, 
-                    edgecolor='none', pad=1))
+        if self._node is None:
+            self._node = subprocess.Popen(
+                ['node', 'cli.js', '--server'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE
+            )
+        return self._node
     
-    def generate_radar_chart(self, data, save_formats=['svg']):
-        """
-        Generate optimized radar chart with multiple format support
+    def _discard_node_worker(self, node):
+        """Kill ``node`` if it is still running, reap it and close its pipes"""
+        if self._node is node:
+            self._node = None
         
-        Args:
-            data: Input data dictionary
-            save_formats: List of formats to save ['svg', 'webp', 'png']
+        if node.poll() is None:
+            node.kill()
+        node.wait()
         
-        Returns:
-            dict: Base64 encoded data for each requested format
-        """
-        try:
-            # Extract data efficiently
-            genetic_results = data["EDAPPGS006"]["ResultInfo"]["genetic_results"]
-            categories = [value["holland_code"] for value in genetic_results.values()]
-            values = [int(value["result"]) for value in genetic_results.values()]
-            
-            n = len(categories)
-            angles = self._calculate_radar_positions(n)
-            
-            # Calculate coordinates
-            coords = [(v * np.cos(theta), v * np.sin(theta)) 
-                    for v, theta in zip(values, angles)]
-            coords.append(coords[0])  # Close polygon
-            x_coords, y_coords = zip(*coords)
-            
-            # Create figure with optimized settings
-            fig, ax = plt.subplots(figsize=(8, 8), dpi=150)
-            
-            # Add grid and labels
-            self._create_radar_grid(ax, angles)
-            self._add_radar_labels(ax, angles)
-            
-            # Add spokes
-            for theta in angles:
-                ax.plot([0, 100*np.cos(theta)], [0, 100*np.sin(theta)], 
-                        '--', color='gray', linewidth=0.5, alpha=0.5)
-            
-            # Plot data
-            ax.plot(x_coords, y_coords, linewidth=2, color='#6A1B9A', zorder=3)
-            ax.fill(x_coords, y_coords, alpha=0.2, color='#E6E6FA', zorder=3)
-            
-            # Add center point
-            ax.plot(0, 0, 'ko', markersize=8, zorder=4)
-            ax.text(0, -3, '0%', ha='center', va='top', 
-                    color='black', fontsize=9, zorder=5)
-            
-            # Final formatting
-            ax.set_aspect('equal')
-            ax.axis('off')
-            plt.xlim(-120, 120)
-            plt.ylim(-120, 120)
-            
-            # Save in requested formats
-            results = {}
-            
-            for fmt in save_formats:
-                buffer = BytesIO()
-                
-                if fmt == 'svg':
-                    plt.savefig(buffer, format='svg', dpi=150, 
-                                bbox_inches='tight', pad_inches=0.1, transparent=True)
-                elif fmt == 'webp':
-                    filename = os.path.join(self.images_dir, 'radar_chart.webp')
-                    plt.savefig(filename, format='webp', dpi=150, 
-                                pil_kwargs={"lossless": False}, 
-                                bbox_inches='tight', pad_inches=0.1, transparent=True)
-                    # Also save to buffer for base64
-                    plt.savefig(buffer, format='png', dpi=150, 
-                                bbox_inches='tight', pad_inches=0.1, transparent=True)
-                else:  # png or other formats
-                    plt.savefig(buffer, format=fmt, dpi=150, 
-                                bbox_inches='tight', pad_inches=0.1, transparent=True)
-                
-                buffer.seek(0)
-                results[fmt] = base64.b64encode(buffer.read()).decode('utf-8')
-                buffer.close()
-            
-            # Clean up
-            plt.close(fig)
-            
-            logger.info("Radar chart generated successfully")
-            return results
-            
-        except Exception as e:
-            logger.error(f"Error generating radar chart: {e}")
-            raise
-    
-    def prepare_pdf_data(self, raw_data):
-        """Prepare and enrich data for PDF generation"""
-        try:
-            # Generate radar chart
-            chart_data = self.generate_radar_chart(raw_data, ['svg'])
-            raw_data["RadarGraphBase64"] = chart_data['svg']
-            
-            return raw_data
-            
-        except Exception as e:
-            logger.error(f"Error preparing PDF data: {e}")
-            raise
+        for pipe in (node.stdin, node.stdout):
+            try:
+                pipe.close()
+            except OSError:
+                pass  # flushing stdin into a dead worker raises BrokenPipeError
     
     def generate_pdf_subprocess(self, data, output_path='output/final.pdf'):
         """
@@ -181,35 +76,72 @@ class PDFGenerator:
         Args:
             data: Dictionary containing PDF data
             output_path: Output file path
+        
+        Returns:
+            str: Path of the generated PDF
+        
+        Raises:
+            subprocess.CalledProcessError: If the Node.js worker exits
+            RuntimeError: If the worker reports a generation failure
         """
-        # try:
         # Prepare data
         prepared_data = self.prepare_pdf_data(data)
         
-        # Convert to compact JSON
-        json_string = json.dumps(prepared_data)
-        
         # Ensure output directory exists
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
-        # node_script_path = os.path.join(os.path.dirname(__file__), 'cli.js')
+        # Send one newline-delimited JSON request to the warm Node.js worker
+        node = self._ensure_node_worker()
+        try:
+            node.stdin.write(_dumps_json({"data": prepared_data, "output": output_path}) + b"\n")
+            node.stdin.flush()
+            response_line = node.stdout.readline()
+        except BrokenPipeError:
+            response_line = b""
+        
+        if not response_line:
+            # The worker exited; its stderr is inherited, so Node's own error
+            # output is already on the terminal
+            returncode = node.wait()
+            self._discard_node_worker(node)
+            raise subprocess.CalledProcessError(returncode, node.args)
         
-        # Run Node.js process with optimized settings
-        process = subprocess.run([
-            'node', 'cli.js',
-            '--data', json_string,
-            '--output', output_path
-        ], check=True)
+        try:
+            response = json.loads(response_line)
+        except ValueError as e:
+            # Anything but a JSON response leaves the protocol out of sync,
+            # so the worker can't be reused
+            self._discard_node_worker(node)
+            raise RuntimeError(f"Unexpected output from Node.js worker: {response_line[:200]!r}") from e
         
-        # return output_path
-            
-        if process.returncode == 0:
-            logger.info(f"✅ PDF generated successfully: {output_path}")
-            return output_path
-        else:
-            logger.error(f"Node.js process failed: {process.stderr}")
-            logger.error(f"Reason --> {process.args, process.stdout}")
-            raise subprocess.CalledProcessError(process.returncode, 'node')
+        if not response.get("ok"):
+            logger.error(f"Node.js worker failed: {response.get('error')}")
+            raise RuntimeError(f"PDF generation failed: {response.get('error')}")
+        
+        logger.info(f"✅ PDF generated successfully: {output_path}")
+        return output_path
+    
+    def close(self):
+        """Shut down the persistent Node.js worker, if one is running"""
+        node = self._node
+        if node is None:
+            return
+        
+        try:
+            if node.poll() is None:
+                node.stdin.write(_dumps_json({"op": "shutdown"}) + b"\n")
+                node.stdin.close()
+                node.wait(timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            pass  # killed below
+        finally:
+            self._discard_node_worker(node)
+    
+    def __del__(self):
+        # No graceful shutdown from the finalizer; main() calls close() for that
+        node = getattr(self, '_node', None)
+        if node is not None:
+            self._discard_node_worker(node)
 
 
 SAMPLE_DATA = {
@@ -695,10 +627,10 @@ def main():
     """Main execution function with error handling and timing"""
     start_time = time.time()
     
+    # Initialize generator
+    pdf_gen = PDFGenerator()
+    
     try:
-        # Initialize generator
-        pdf_gen = PDFGenerator()
-        
         output_path = 'output/optimized_final.pdf'
         
         # Generate PDF
@@ -718,6 +650,8 @@ def main():
     except Exception as e:
         logger.error(f"❌ Generation failed: {e}")
         raise
+    finally:
+        pdf_gen.close()
 
 if __name__ == '__main__':
     main()
\ No newline at end of file